@@ -16,6 +16,18 @@ Event Structure:
 
 import json
 from typing import Any
+import logging
+import os
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Response parts built once at import; only the request path and method vary
+_JSON_HEADERS: dict[str, str] = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+_BODY_TEMPLATE: str = '{"message":"Auth endpoint not implemented yet","received_path":%s,"received_method":%s}'
 
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
@@ -39,21 +51,14 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             - body (str): JSON string with response message
     """
 
-    # Log the incoming event (you'll see this in SAM logs)
-    print(f"Received event: {json.dumps(event)}")
+    # Log the incoming event (run with LOG_LEVEL=DEBUG to see it in SAM logs)
+    logger.debug("Received event: %s", event)
 
     http_method = event['httpMethod']
     path = event['path']
 
     return {
         'statusCode': 501,  # 501 = Not Implemented
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps({
-            'message': 'Auth endpoint not implemented yet',
-            'received_path': path,
-            'received_method': http_method
-        })
+        'headers': _JSON_HEADERS,
+        'body': _BODY_TEMPLATE % (json.dumps(path), json.dumps(http_method))
     }
@@ -18,6 +18,21 @@ Future Implementation:
 
 import json
 from typing import Any
+import logging
+import os
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Response parts built once at import; only the request path and method vary
+_JSON_HEADERS: dict[str, str] = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+_BODY_TEMPLATE: str = (
+    '{"message":"Bookings endpoint not implemented yet","received_path":%s,"received_method":%s,'
+    '"note":"Will handle: create booking, list bookings, cancel booking"}'
+)
 
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
@@ -42,21 +57,13 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             - body (str): JSON string with response message
     """
 
-    print(f"Received event: {json.dumps(event)}")
+    logger.debug("Received event: %s", event)
 
     http_method = event['httpMethod']
     path = event['path']
 
     return {
         'statusCode': 501,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps({
-            'message': 'Bookings endpoint not implemented yet',
-            'received_path': path,
-            'received_method': http_method,
-            'note': 'Will handle: create booking, list bookings, cancel booking'
-        })
+        'headers': _JSON_HEADERS,
+        'body': _BODY_TEMPLATE % (json.dumps(path), json.dumps(http_method))
     }
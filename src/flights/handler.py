@@ -4,38 +4,327 @@ This module handles flight search and listing operations. It interacts with
 DynamoDB to retrieve flight information.
 
 Endpoints:
-    GET /flights              - List all available flights
+    GET /flights              - List flights, one page at a time
+    GET /flights?origin=MAD   - List flights departing from an origin airport
+    GET /flights?ids=FL1,FL2  - Get several flights by ID in one request
     GET /flights/{flight_id}  - Get details of a specific flight
 
 DynamoDB Integration:
     Uses the FlightsTable to query flight data. Table structure:
     - Primary Key: flight_id (String)
     - GSI: origin-index for searching by origin airport
+
+Response Formats:
+    JSON by default. GET /flights returns MessagePack instead when the request's
+    Accept header includes application/msgpack (e.g. internal service callers).
+    API Gateway compresses large responses for clients that send Accept-Encoding.
 """
 
-from typing import Any
-import boto3
-import json
+from cachetools import TTLCache
+from types import SimpleNamespace
+from typing import Any, Callable
+import base64
+import logging
+import msgspec
 import os
+import time
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Environment configuration, read and validated once at import so a misconfigured
+# function fails its cold start with a clear error message
+_CFG = SimpleNamespace(
+    flights_table=os.environ.get('FLIGHTS_TABLE', ''),
+    region=os.environ.get('AWS_REGION'),  # None lets botocore resolve the region
+)
+if not _CFG.flights_table:
+    raise RuntimeError('FLIGHTS_TABLE environment variable is not set')
+
+# Pagination settings for GET /flights
+ORIGIN_INDEX: str = 'origin-index'
+DEFAULT_PAGE_SIZE: int = 50
+MAX_PAGE_SIZE: int = 100
+
+# Attributes a pagination cursor may carry: the table key for scans, plus the
+# origin-index key for queries. Each value is a string or number attribute.
+_SCAN_CURSOR_KEYS: frozenset[str] = frozenset({'flight_id'})
+_QUERY_CURSOR_KEYS: frozenset[str] = frozenset({'flight_id', 'origin'})
+_CURSOR_VALUE_TYPES: frozenset[str] = frozenset({'S', 'N'})
+
+# BatchGetItem settings for GET /flights?ids=...
+BATCH_GET_MAX_KEYS: int = 100  # DynamoDB limit per BatchGetItem call
+BATCH_GET_MAX_RETRIES: int = 5
+BATCH_GET_BASE_DELAY: float = 0.05  # Seconds, doubled on every retry
+# Filters and paging that the ids lookup would silently ignore, so they are rejected
+_IDS_EXCLUSIVE_PARAMS: frozenset[str] = frozenset({'origin', 'limit', 'cursor'})
+
+# get_flight response cache, shared by warm invocations of the same container
+FLIGHT_CACHE_SIZE: int = 512
+FLIGHT_CACHE_TTL: int = 30  # Seconds; bounds how stale a cached flight can be
+
+MSGPACK_CONTENT_TYPE: str = 'application/msgpack'
+
+# DynamoDB low-level client and item deserializer. Both are created on first use
+# (see _get_dynamodb) and reused by warm invocations, so requests that never
+# reach DynamoDB do not pay for importing boto3/botocore during cold start.
+_dynamodb: Any = None  # DynamoDB.Client
+_deserialize: Any = None  # Bound boto3.dynamodb.types.TypeDeserializer().deserialize
+# botocore's ClientError and BotoCoreError once the client exists. Until then no
+# DynamoDB call has been made, so the empty tuple catching nothing is correct.
+_dynamodb_errors: tuple[type[Exception], ...] = ()
+
+# Serialized 200 responses of recent get_flight calls, keyed by flight_id
+_flight_cache: TTLCache = TTLCache(maxsize=FLIGHT_CACHE_SIZE, ttl=FLIGHT_CACHE_TTL)
+
+
+class Flight(msgspec.Struct, omit_defaults=True):
+    """Flight item as stored in FlightsTable, used for every flight response.
+
+    Attributes missing from the item are left out of the encoded output.
+    """
+
+    flight_id: str
+    origin: str | None = None
+    destination: str | None = None
+    price: float | None = None
+    departure_time: str | None = None
+    arrival_time: str | None = None
+    available_seats: int | None = None
+
+
+# Only the Flight attributes are read from DynamoDB. Every name goes through a
+# placeholder so none of them can clash with a DynamoDB reserved word.
+_PROJECTION_NAMES: dict[str, str] = {f'#{name}': name for name in Flight.__struct_fields__}
+_PROJECTION_EXPRESSION: str = ', '.join(_PROJECTION_NAMES)
+
+# Schema-aware encoders for Flight responses, built once and reused by warm invocations
+_JSON_ENCODER = msgspec.json.Encoder()
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+
+# Response parts built once at import and shared by every invocation
+_JSON_HEADERS: dict[str, str] = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+_MSGPACK_HEADERS: dict[str, str] = {
+    'Content-Type': MSGPACK_CONTENT_TYPE,
+    'Access-Control-Allow-Origin': '*'
+}
+
+# get_flight success bodies always share this envelope around the item JSON
+_OK_PREFIX: str = '{"success":true,"data":'
+_OK_SUFFIX: str = '}'
+
+# Prebuilt client error responses, returned as-is without any allocation
+_ERR_NOT_FOUND: dict[str, Any] = {
+    'statusCode': 404,
+    'headers': _JSON_HEADERS,
+    'body': '{"error":"Not found"}'
+}
+_ERR_INVALID_PAGE: dict[str, Any] = {
+    'statusCode': 400,
+    'headers': _JSON_HEADERS,
+    'body': '{"error":"Invalid limit or cursor"}'
+}
+_ERR_INVALID_IDS: dict[str, Any] = {
+    'statusCode': 400,
+    'headers': _JSON_HEADERS,
+    'body': f'{{"error":"ids takes 1 to {MAX_PAGE_SIZE} flights and no origin, limit or cursor"}}'
+}
+_ERR_MISSING_ID: dict[str, Any] = {
+    'statusCode': 400,
+    'headers': _JSON_HEADERS,
+    'body': '{"error":"Missing flight_id"}'
+}
+_ERR_FLIGHT_NOT_FOUND: dict[str, Any] = {
+    'statusCode': 404,
+    'headers': _JSON_HEADERS,
+    'body': '{"error":"Flight not found"}'
+}
+
+# Prebuilt responses for DynamoDB failures, keyed by ClientError code
+_ERR_INTERNAL: dict[str, Any] = {
+    'statusCode': 500,
+    'headers': _JSON_HEADERS,
+    'body': '{"error":"Internal server error"}'
+}
+_ERR_THROTTLED: dict[str, Any] = {
+    'statusCode': 503,
+    'headers': _JSON_HEADERS,
+    'body': '{"error":"Too many requests, please retry"}'
+}
+_ERR_RESPONSES: dict[str, dict[str, Any]] = {
+    'ResourceNotFoundException': {
+        'statusCode': 500,
+        'headers': _JSON_HEADERS,
+        'body': '{"error":"Flights table not found"}'
+    },
+    'ProvisionedThroughputExceededException': _ERR_THROTTLED,
+    'RequestLimitExceeded': _ERR_THROTTLED,
+    'ThrottlingException': _ERR_THROTTLED,
+}
+
+
+def _get_dynamodb() -> Any:
+    """Return the shared DynamoDB client, creating it on the first call.
+
+    The resource API is avoided because loading its model slows down cold starts.
+    """
+    global _dynamodb, _deserialize, _dynamodb_errors
+
+    if _dynamodb is None:
+        from boto3.dynamodb.types import TypeDeserializer
+        from botocore.config import Config
+        from botocore.exceptions import BotoCoreError, ClientError
+        import botocore.session
+
+        # Set first so that errors raised while creating the client (e.g. NoRegionError)
+        # are caught by the handlers too
+        _dynamodb_errors = (ClientError, BotoCoreError)
+        _dynamodb = botocore.session.get_session().create_client(
+            'dynamodb',
+            region_name=_CFG.region,
+            config=Config(tcp_keepalive=True, retries={'mode': 'standard', 'max_attempts': 2})
+        )
+        _deserialize = TypeDeserializer().deserialize
+
+    return _dynamodb
+
+
+def _error_response(error: Exception) -> dict[str, Any]:
+    """Map a failed DynamoDB call to one of the prebuilt error responses.
+
+    Args:
+        error: botocore ClientError or BotoCoreError
+
+    Returns:
+        API Gateway response dict for the error code, or a generic 500.
+    """
+    logger.error("DynamoDB request failed: %s", error)
+    return _ERR_RESPONSES.get(_error_code(error), _ERR_INTERNAL)
+
+
+def _error_code(error: Exception) -> str | None:
+    """Return the DynamoDB error code of a ClientError, or None for other errors."""
+    # Only ClientError carries a response with an error code
+    return getattr(error, 'response', {}).get('Error', {}).get('Code')
+
+
+def _is_rejected_start_key(error: Exception) -> bool:
+    """Tell whether a failed scan/query was rejected because of its ExclusiveStartKey.
+
+    Used only for requests that sent a cursor, where a malformed key is the
+    client's fault rather than a server error.
+    """
+    from botocore.exceptions import ParamValidationError  # Loaded with the client
+
+    return isinstance(error, ParamValidationError) or _error_code(error) == 'ValidationException'
+
+
+def _number(value: str) -> int | float:
+    """Parse a DynamoDB number string as an int when integral, else a float."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _from_dynamodb(item: dict[str, Any]) -> dict[str, Any]:
+    """Convert a low-level DynamoDB item ({'price': {'N': '89.99'}}) to Python values.
+
+    Top-level numbers become int/float so they match the Flight field types;
+    nested values keep the Decimal type TypeDeserializer produces.
+    """
+    return {
+        key: _number(value['N']) if 'N' in value else _deserialize(value)
+        for key, value in item.items()
+    }
+
+
+def _flights_from_dynamodb(items: list[dict[str, Any]]) -> list[Flight]:
+    """Convert a page of low-level DynamoDB items into Flight structs.
+
+    Each attribute is deserialized exactly once, and the whole page is validated
+    by a single msgspec.convert call instead of one call per item. If that fails,
+    items are converted one by one so a malformed item is logged and skipped
+    instead of failing the whole page.
+    """
+    records = [_from_dynamodb(item) for item in items]
+    try:
+        return msgspec.convert(records, list[Flight])
+    except msgspec.ValidationError:
+        pass
 
-# Environment variables
-FLIGHTS_TABLE: str = os.environ['FLIGHTS_TABLE']
+    flights: list[Flight] = []
+    for record in records:
+        try:
+            flights.append(msgspec.convert(record, Flight))
+        except msgspec.ValidationError as e:
+            logger.error("Flight %s does not match the Flight schema: %s", record.get('flight_id'), e)
+    return flights
 
-# DynamoDB resources (types from boto3.resources.base)
-dynamodb: Any = boto3.resource('dynamodb')  # DynamoDBServiceResource
-table: Any = dynamodb.Table(FLIGHTS_TABLE)  # Table
+
+def _header(event: dict[str, Any], name: str) -> str:
+    """Return a request header value, matching ``name`` case-insensitively.
+
+    Args:
+        event: API Gateway event with an optional 'headers' dict
+        name: Lowercase header name (e.g. 'accept')
+
+    Returns:
+        The header value, or an empty string if it was not sent.
+    """
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name:
+            return value
+    return ''
+
+
+def _encode_cursor(last_key: dict[str, Any] | None) -> str | None:
+    """Turn a DynamoDB LastEvaluatedKey into an opaque URL-safe cursor."""
+    if not last_key:
+        return None
+    return base64.urlsafe_b64encode(_JSON_ENCODER.encode(last_key)).decode()
+
+
+def _decode_cursor(cursor: str, key_names: frozenset[str]) -> dict[str, Any] | None:
+    """Turn a cursor from ``_encode_cursor`` back into an ExclusiveStartKey.
+
+    Args:
+        cursor: nextCursor value sent by the client ('' if none)
+        key_names: Attribute names the key must have for the scan or query
+
+    Raises:
+        ValueError: If the cursor is not base64-encoded JSON holding exactly
+                    ``key_names``, each as a single {'S'|'N': str} value.
+    """
+    if not cursor:
+        return None
+    try:
+        start_key = msgspec.json.decode(
+            base64.urlsafe_b64decode(cursor), type=dict[str, dict[str, str]]
+        )
+    except msgspec.DecodeError as e:  # Not a ValueError (also covers ValidationError)
+        raise ValueError('Cursor is not a valid key') from e
+    if start_key.keys() != key_names or any(
+        len(value) != 1 or value.keys() - _CURSOR_VALUE_TYPES for value in start_key.values()
+    ):
+        raise ValueError('Cursor does not match this listing')
+    return start_key
 
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """Route flight requests to appropriate handler functions.
 
     This is the main entry point for the Flights Lambda function. Routes requests
-    based on HTTP method and path to the appropriate handler.
+    by looking up the HTTP method and the resource template API Gateway matched
+    (e.g. '/flights/{flight_id}') in the _ROUTES table.
 
     Args:
         event: API Gateway event containing:
             - httpMethod (str): HTTP method (GET)
-            - path (str): Request path (/flights or /flights/{flight_id})
+            - resource (str): Matched route template (/flights or /flights/{flight_id})
             - pathParameters (dict): URL parameters (flight_id if present)
         context: Lambda context object with runtime information
 
@@ -43,33 +332,90 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         API Gateway response dict from list_flights or get_flight handlers,
         or 404 error if route not found.
     """
-    http_method = event['httpMethod']
-    path = event['path']
+    route = _ROUTES.get((event['httpMethod'], event.get('resource', '')))
 
-    if http_method == 'GET':
-        if path == '/flights':
-            return list_flights(event) or {'statusCode': 204, 'body': 'No flights found'}
-        elif '/flights/' in path:
-            return get_flight(event) or {'statusCode': 204, 'body': 'Flight not found'}
+    if route is None:
+        return _ERR_NOT_FOUND
 
-    return {
-        'statusCode': 404,
-        'body': json.dumps({'error': 'Not found'})
-    }
+    return route(event)
+
+
+def _batch_get_items(flight_ids: list[str]) -> list[dict[str, Any]]:
+    """Fetch several flights with BatchGetItem, 100 keys per call.
+
+    Keys DynamoDB leaves in UnprocessedKeys (e.g. when throttled) are retried
+    with exponential backoff.
+
+    Args:
+        flight_ids: Unique flight IDs to fetch
+
+    Returns:
+        Low-level DynamoDB items in the order of ``flight_ids``; IDs that do not
+        exist are skipped.
+
+    Raises:
+        ClientError: From DynamoDB, or with the ProvisionedThroughputExceededException
+                     code if some keys are still unprocessed after all retries.
+    """
+    found: dict[str, dict[str, Any]] = {}
+
+    for start in range(0, len(flight_ids), BATCH_GET_MAX_KEYS):
+        request_items: dict[str, Any] = {
+            _CFG.flights_table: {
+                'Keys': [{'flight_id': {'S': flight_id}}
+                         for flight_id in flight_ids[start:start + BATCH_GET_MAX_KEYS]],
+                'ProjectionExpression': _PROJECTION_EXPRESSION,
+                'ExpressionAttributeNames': _PROJECTION_NAMES
+            }
+        }
+
+        for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(BATCH_GET_BASE_DELAY * 2 ** (attempt - 1))
+
+            response = _get_dynamodb().batch_get_item(RequestItems=request_items)
+            for item in response['Responses'].get(_CFG.flights_table, []):
+                found[item['flight_id']['S']] = item
+
+            request_items = response.get('UnprocessedKeys')
+            if not request_items:
+                break
+        else:
+            from botocore.exceptions import ClientError
+
+            raise ClientError(
+                {'Error': {'Code': 'ProvisionedThroughputExceededException',
+                           'Message': 'Keys still unprocessed after retries'}},
+                'BatchGetItem'
+            )
+
+    return [found[flight_id] for flight_id in flight_ids if flight_id in found]
 
 
 def list_flights(event: dict[str, Any]) -> dict[str, Any]:
-    """List all available flights from the database.
+    """List one page of flights from the database.
 
-    Performs a full table scan of FlightsTable to retrieve all flights.
-    Note: In production, consider using pagination for large datasets.
+    When an origin is given, queries the origin-index GSI so only matching
+    flights are read; otherwise scans FlightsTable. Both paths read at most
+    ``limit`` items per invocation and return a cursor for the next page.
+    When a list of IDs is given, fetches exactly those flights with
+    BatchGetItem instead, with no pagination.
 
     Args:
-        event: API Gateway event (not currently used, reserved for future filtering)
+        event: API Gateway event containing:
+            - queryStringParameters (dict, optional):
+                - origin (str): Origin airport code to filter by
+                - limit (str): Page size (default 50, max 100)
+                - cursor (str): nextCursor value from a previous response
+                - ids (str): Comma-separated flight IDs to fetch (1 to 100;
+                             cannot be combined with origin, limit or cursor)
+            - headers (dict, optional): Accept: application/msgpack selects
+                                        a MessagePack body
 
     Returns:
         API Gateway response dict containing:
-            - statusCode (int): 200 on success, 500 on error
+            - statusCode (int): 200 on success, 400 on invalid parameters,
+                               503 if throttled, 500 on other errors
             - headers (dict): Response headers including CORS
             - body (str): JSON string with flight list:
                 {
@@ -82,36 +428,93 @@ def list_flights(event: dict[str, Any]) -> dict[str, Any]:
                             'price': 89.99,
                             ...
                         }
-                    ]
+                    ],
+                    'nextCursor': 'eyJmbGlnaHRfaWQiOnsiUyI6IkZMMTIzIn19'  # None on the last page
                 }
+              or, for MessagePack, the encoded bytes in base64 with
+              isBase64Encoded set to True.
     """
+    query_params: dict[str, str] = event.get('queryStringParameters') or {}
+    origin: str = query_params.get('origin', '')
+    # dict.fromkeys drops duplicates, which BatchGetItem rejects, and keeps order
+    flight_ids: list[str] = list(dict.fromkeys(
+        flight_id for flight_id in query_params.get('ids', '').split(',') if flight_id
+    ))
+
+    if 'ids' in query_params and (
+        not 0 < len(flight_ids) <= MAX_PAGE_SIZE
+        or not _IDS_EXCLUSIVE_PARAMS.isdisjoint(query_params)
+    ):
+        return _ERR_INVALID_IDS
+
     try:
-        response = table.scan()
+        limit = int(query_params.get('limit', DEFAULT_PAGE_SIZE))
+        if limit < 1:
+            raise ValueError('Limit must be positive')
+        start_key = _decode_cursor(
+            query_params.get('cursor', ''),
+            _QUERY_CURSOR_KEYS if origin else _SCAN_CURSOR_KEYS
+        )
+    except ValueError:
+        return _ERR_INVALID_PAGE
 
-        items: list[dict[str, Any]] = response.get('Items', [])
+    page_args: dict[str, Any] = {'Limit': min(limit, MAX_PAGE_SIZE)}
+    if start_key:
+        page_args['ExclusiveStartKey'] = start_key
 
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'success': True,
-                'data': items
-            })
+    try:
+        if flight_ids:
+            response = {'Items': _batch_get_items(flight_ids)}
+        elif origin:
+            response = _get_dynamodb().query(
+                TableName=_CFG.flights_table,
+                IndexName=ORIGIN_INDEX,
+                KeyConditionExpression='#origin = :origin',
+                ExpressionAttributeValues={':origin': {'S': origin}},
+                ProjectionExpression=_PROJECTION_EXPRESSION,
+                ExpressionAttributeNames=_PROJECTION_NAMES,
+                **page_args
+            )
+        else:
+            response = _get_dynamodb().scan(
+                TableName=_CFG.flights_table,
+                ProjectionExpression=_PROJECTION_EXPRESSION,
+                ExpressionAttributeNames=_PROJECTION_NAMES,
+                **page_args
+            )
+
+        flights: list[Flight] = _flights_from_dynamodb(response.get('Items', []))
+        page = {
+            'success': True,
+            'data': flights,
+            'nextCursor': _encode_cursor(response.get('LastEvaluatedKey'))
         }
-    except Exception as e:
+
+        if MSGPACK_CONTENT_TYPE in _header(event, 'accept'):
+            return {
+                'statusCode': 200,
+                'isBase64Encoded': True,
+                'headers': _MSGPACK_HEADERS,
+                'body': base64.b64encode(_MSGPACK_ENCODER.encode(page)).decode()
+            }
+
         return {
-            'statusCode': 500,
-            'body': json.dumps({'error': str(e)})
+            'statusCode': 200,
+            'headers': _JSON_HEADERS,
+            'body': _JSON_ENCODER.encode(page).decode()
         }
+    except _dynamodb_errors as e:
+        if start_key and _is_rejected_start_key(e):
+            return _ERR_INVALID_PAGE
+        return _error_response(e)
 
 
 def get_flight(event: dict[str, Any]) -> dict[str, Any]:
     """Get details of a specific flight by ID.
 
     Retrieves a single flight from FlightsTable using the flight_id from URL.
+    Successful responses are cached for FLIGHT_CACHE_TTL seconds, so repeated
+    lookups of the same flight within a warm container skip DynamoDB.
 
     Args:
         event: API Gateway event containing:
@@ -120,7 +523,8 @@ def get_flight(event: dict[str, Any]) -> dict[str, Any]:
     Returns:
         API Gateway response dict containing:
             - statusCode (int): 200 on success, 400 if missing ID,
-                               404 if not found, 500 on error
+                               404 if not found, 503 if throttled,
+                               500 on other errors
             - headers (dict): Response headers including CORS
             - body (str): JSON string with flight details:
                 {
@@ -140,40 +544,47 @@ def get_flight(event: dict[str, Any]) -> dict[str, Any]:
     flight_id: str = path_params.get('flight_id', '')
 
     if not flight_id:
-        return {
-            'statusCode': 400,
-            'body': json.dumps({'error': 'Missing flight_id'})
-        }
+        return _ERR_MISSING_ID
+
+    cached: dict[str, Any] | None = _flight_cache.get(flight_id)
+    if cached is not None:
+        return cached
 
     try:
-        response = table.get_item(Key={'flight_id': flight_id})  # Must match the primary_key
+        response = _get_dynamodb().get_item(
+            TableName=_CFG.flights_table,
+            Key={'flight_id': {'S': flight_id}},  # Must match the primary_key
+            ProjectionExpression=_PROJECTION_EXPRESSION,
+            ExpressionAttributeNames=_PROJECTION_NAMES
+        )
 
         # response structure:
         # {
-        #     'Item': {...}     # The item or None if not found
+        #     'Item': {'flight_id': {'S': 'FL123'}, ...}     # Missing if not found
         # }
 
-        item: dict = response.get('Item')
+        if 'Item' not in response:
+            return _ERR_FLIGHT_NOT_FOUND
 
-        if not item:
-            return {
-                'statusCode': 404,
-                'body': json.dumps({'error': 'Flight not found'})
-            }
+        flight: Flight = msgspec.convert(_from_dynamodb(response['Item']), Flight)
 
-        return {
+        flight_response = {
             'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'success': True,
-                'data': item
-            })
-        }
-    except Exception as e:
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': str(e)})
+            'headers': _JSON_HEADERS,
+            'body': _OK_PREFIX + _JSON_ENCODER.encode(flight).decode() + _OK_SUFFIX
         }
+        _flight_cache[flight_id] = flight_response
+
+        return flight_response
+    except msgspec.ValidationError as e:
+        logger.error("Flight %s does not match the Flight schema: %s", flight_id, e)
+        return _ERR_INTERNAL
+    except _dynamodb_errors as e:
+        return _error_response(e)
+
+
+# Route table for lambda_handler, keyed by (httpMethod, resource template)
+_ROUTES: dict[tuple[str, str], Callable[[dict[str, Any]], dict[str, Any]]] = {
+    ('GET', '/flights'): list_flights,
+    ('GET', '/flights/{flight_id}'): get_flight,
+}
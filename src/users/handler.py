@@ -15,6 +15,37 @@ Future Implementation:
 
 import json
 from typing import Any
+import logging
+import os
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Response parts built once at import; only the request details vary
+_JSON_HEADERS: dict[str, str] = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+_BODY_TEMPLATE: str = (
+    '{"message":"Users endpoint not implemented yet","received_path":%s,"received_method":%s,'
+    '"has_auth_header":%s,"note":"Will return user profile based on JWT token"}'
+)
+
+
+def _header(event: dict[str, Any], name: str) -> str:
+    """Return a request header value, matching ``name`` case-insensitively.
+
+    Args:
+        event: API Gateway event with an optional 'headers' dict
+        name: Lowercase header name (e.g. 'authorization')
+
+    Returns:
+        The header value, or an empty string if it was not sent.
+    """
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name:
+            return value
+    return ''
 
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
@@ -37,26 +68,20 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             - body (str): JSON string with response message and auth status
     """
 
-    print(f"Received event: {json.dumps(event)}")
+    logger.debug("Received event: %s", event)
 
     http_method = event['httpMethod']
     path = event['path']
 
     # Check if Authorization header exists (even though we're not using it yet)
-    headers = event.get('headers', {})
-    auth_header = headers.get('Authorization') or headers.get('authorization')
+    auth_header = _header(event, 'authorization')
 
     return {
         'statusCode': 501,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps({
-            'message': 'Users endpoint not implemented yet',
-            'received_path': path,
-            'received_method': http_method,
-            'has_auth_header': auth_header is not None,
-            'note': 'Will return user profile based on JWT token'
-        })
+        'headers': _JSON_HEADERS,
+        'body': _BODY_TEMPLATE % (
+            json.dumps(path),
+            json.dumps(http_method),
+            'true' if auth_header else 'false'
+        )
     }
@@ -0,0 +1,53 @@
+"""Regression checks for GET /flights pagination cursor validation.
+
+Malformed cursors must be rejected with a 400 before DynamoDB is called,
+never raised out of lambda_handler (API Gateway turns that into a 502).
+"""
+
+import base64
+import importlib.util
+import pathlib
+
+import pytest
+
+HANDLER_PATH = pathlib.Path(__file__).parent.parent / 'src' / 'flights' / 'handler.py'
+
+
+@pytest.fixture(scope='module')
+def flights(monkeypatch_module):
+    """Load src/flights/handler.py, which requires FLIGHTS_TABLE at import."""
+    monkeypatch_module.setenv('FLIGHTS_TABLE', 'FlightsTable')
+    spec = importlib.util.spec_from_file_location('flights_handler', HANDLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def monkeypatch_module():
+    with pytest.MonkeyPatch.context() as patch:
+        yield patch
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+@pytest.mark.parametrize('cursor', [
+    '!!!',                                  # Decodes to empty bytes
+    'abc',                                  # Bad base64 padding
+    _b64(b'not json'),
+    _b64(b'[1,2]'),
+    _b64(b'{"flight_id":"FL1"}'),           # Value is not a typed attribute
+    _b64(b'{"flight_id":{"B":"FL1"}}'),     # Unsupported attribute type
+    _b64(b'{"flight_id":{"S":"FL1"},"origin":{"S":"MAD"}}'),  # Query key on a scan
+])
+def test_malformed_cursor_returns_400(flights, cursor):
+    response = flights.lambda_handler({
+        'httpMethod': 'GET',
+        'resource': '/flights',
+        'queryStringParameters': {'cursor': cursor}
+    }, None)
+
+    assert response['statusCode'] == 400
+    assert response['body'] == '{"error":"Invalid limit or cursor"}'